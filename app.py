@@ -1,122 +1,33 @@
-from flask import Flask, render_template, request, redirect, url_for, flash, jsonify, abort
-from flask_sqlalchemy import SQLAlchemy
-from flask_login import LoginManager, UserMixin, login_user, logout_user, login_required, current_user
+import click
+from flask import Flask, Blueprint, current_app, render_template, request, redirect, url_for, flash, jsonify, abort
+from flask_login import login_user, logout_user, login_required, current_user
 from werkzeug.security import generate_password_hash, check_password_hash
 from werkzeug.utils import secure_filename
 from datetime import datetime
+import math
 import os
-from flask_ckeditor import CKEditor, upload_fail, upload_success
+import threading
+import time
+from flask_ckeditor import upload_fail, upload_success
 from config import Config
+from extensions import db, ckeditor, login_manager
+from models import User, Category, Question, Answer, Vote, Tag, QuestionTag, Notification
 
-app = Flask(__name__)
-app.config.from_object(Config)
-db = SQLAlchemy(app)
-ckeditor = CKEditor(app)
-
-# ========== DATABASE MODELS ==========
-class User(UserMixin, db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    username = db.Column(db.String(80), unique=True, nullable=False)
-    email = db.Column(db.String(120), unique=True, nullable=False)
-    password_hash = db.Column(db.String(120), nullable=False)
-    is_admin = db.Column(db.Boolean, default=False)
-    reputation = db.Column(db.Integer, default=0)
-    bio = db.Column(db.Text)
-    profile_picture = db.Column(db.String(120))
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    
-    questions = db.relationship('Question', backref='author', lazy=True)
-    answers = db.relationship('Answer', backref='author', lazy=True)
-    votes = db.relationship('Vote', backref='user', lazy=True)
-    notifications = db.relationship('Notification', backref='user', lazy=True, 
-                                  order_by='Notification.created_at.desc()')
-
-class Category(db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    name = db.Column(db.String(50), unique=True, nullable=False)
-    description = db.Column(db.Text)
-    questions = db.relationship('Question', backref='category', lazy=True)
-
-class Question(db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    title = db.Column(db.String(200), nullable=False)
-    content = db.Column(db.Text, nullable=False)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow)
-    views = db.Column(db.Integer, default=0)
-    is_approved = db.Column(db.Boolean, default=True)
-    
-    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
-    category_id = db.Column(db.Integer, db.ForeignKey('category.id'))
-    
-    answers = db.relationship('Answer', backref='question', lazy=True, 
-                            cascade='all, delete-orphan')
-    votes = db.relationship('Vote', backref='question', lazy=True, 
-                          cascade='all, delete-orphan')
-    tags = db.relationship('QuestionTag', back_populates='question', 
-                         cascade='all, delete-orphan')
-
-    def get_vote_score(self):
-        upvotes = Vote.query.filter_by(question_id=self.id, vote_type='up').count()
-        downvotes = Vote.query.filter_by(question_id=self.id, vote_type='down').count()
-        return upvotes - downvotes
-
-class Answer(db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    content = db.Column(db.Text, nullable=False)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow)
-    is_approved = db.Column(db.Boolean, default=True)
-    is_accepted = db.Column(db.Boolean, default=False)
-    
-    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
-    question_id = db.Column(db.Integer, db.ForeignKey('question.id'), nullable=False)
-    
-    votes = db.relationship('Vote', backref='answer', lazy=True, 
-                          cascade='all, delete-orphan')
-
-    def get_vote_score(self):
-        upvotes = Vote.query.filter_by(answer_id=self.id, vote_type='up').count()
-        downvotes = Vote.query.filter_by(answer_id=self.id, vote_type='down').count()
-        return upvotes - downvotes
-
-class Vote(db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    vote_type = db.Column(db.String(10), nullable=False)  # 'up' or 'down'
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    
-    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
-    question_id = db.Column(db.Integer, db.ForeignKey('question.id'), nullable=True)
-    answer_id = db.Column(db.Integer, db.ForeignKey('answer.id'), nullable=True)
-
-class Tag(db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    name = db.Column(db.String(50), unique=True, nullable=False)
-    questions = db.relationship('QuestionTag', back_populates='tag')
-
-class QuestionTag(db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    question_id = db.Column(db.Integer, db.ForeignKey('question.id'))
-    tag_id = db.Column(db.Integer, db.ForeignKey('tag.id'))
-    question = db.relationship('Question', back_populates='tags')
-    tag = db.relationship('Tag', back_populates='questions')
-
-class Notification(db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
-    content = db.Column(db.Text, nullable=False)
-    is_read = db.Column(db.Boolean, default=False)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    link = db.Column(db.String(200))
-
-# ========== LOGIN MANAGER ==========
-login_manager = LoginManager()
-login_manager.init_app(app)
-login_manager.login_view = 'login'
-
-@login_manager.user_loader
-def load_user(user_id):
-    return User.query.get(int(user_id))
+bp = Blueprint('main', __name__, cli_group=None)
+
+# ========== APP FACTORY ==========
+def create_app(config=Config):
+    """Build an app instance. Nothing here touches the database, so importing and
+    creating the app is cheap and safe to do before forking workers."""
+    app = Flask(__name__)
+    app.config.from_object(config)
+    
+    db.init_app(app)
+    ckeditor.init_app(app)
+    login_manager.init_app(app)
+    app.register_blueprint(bp)
+    
+    return app
 
 # ========== HELPER FUNCTIONS ==========
 def create_notification(user_id, content, link=None):
@@ -129,41 +40,225 @@ def create_notification(user_id, content, link=None):
         db.session.add(notification)
         db.session.commit()
     except Exception as e:
-        app.logger.error(f"Error creating notification: {str(e)}")
+        current_app.logger.error(f"Error creating notification: {str(e)}")
         db.session.rollback()
 
 def validate_tags(tag_string, max_tags=5):
     tags = [t.strip() for t in tag_string.split(',') if t.strip()]
     return tags[:max_tags]
 
+MODERATION_MODELS = {'question': Question, 'answer': Answer}
+MODERATION_ACTIONS = {'approve': 'approved', 'reject': 'rejected'}
+
+def get_pending_items(model, after_id=None, limit=None):
+    """Keyset page of unapproved items, served from the partial pending index"""
+    limit = limit or current_app.config['MODERATION_PAGE_SIZE']
+    query = model.query.options(db.selectinload(model.author)).filter(model.is_approved == False)
+    if model is Answer:
+        query = query.options(db.selectinload(Answer.question))
+    if after_id:
+        query = query.filter(model.id > after_id)
+    items = query.order_by(model.id).limit(limit).all()
+    next_after = items[-1].id if len(items) == limit else None
+    return items, next_after
+
+def parse_moderation_ids(raw_ids):
+    """Sorted unique ids from a bulk request, or None if any of them is not an integer.
+    JSON integers and digit strings from forms are accepted, floats and booleans are not."""
+    ids = set()
+    for i in raw_ids:
+        if isinstance(i, int) and not isinstance(i, bool):
+            ids.add(i)
+        elif isinstance(i, str) and i.isascii() and i.isdigit():
+            ids.add(int(i))
+        else:
+            return None
+    return sorted(ids)
+
+def moderate_items(type, ids, action):
+    """Approve or reject pending items in one transaction, returns the number handled"""
+    model = MODERATION_MODELS[type]
+    if not ids:
+        return 0
+
+    if model is Question:
+        rows = db.session.query(Question.id, Question.user_id, Question.id, Question.title).filter(
+            Question.id.in_(ids), Question.is_approved == False
+        ).all()
+    else:
+        rows = db.session.query(Answer.id, Answer.user_id, Answer.question_id, Question.title).join(
+            Question, Answer.question_id == Question.id
+        ).filter(Answer.id.in_(ids), Answer.is_approved == False).all()
+
+    item_ids = [row[0] for row in rows]
+    if not item_ids:
+        return 0
+
+    if action == 'approve':
+        model.query.filter(model.id.in_(item_ids)).update(
+            {'is_approved': True}, synchronize_session=False)
+    elif model is Question:
+        answer_ids = db.session.query(Answer.id).filter(Answer.question_id.in_(item_ids))
+        Vote.query.filter(Vote.question_id.in_(item_ids) | Vote.answer_id.in_(answer_ids)).delete(
+            synchronize_session=False)
+        QuestionTag.query.filter(QuestionTag.question_id.in_(item_ids)).delete(synchronize_session=False)
+        Answer.query.filter(Answer.question_id.in_(item_ids)).delete(synchronize_session=False)
+        Question.query.filter(Question.id.in_(item_ids)).delete(synchronize_session=False)
+    else:
+        Vote.query.filter(Vote.answer_id.in_(item_ids)).delete(synchronize_session=False)
+        Answer.query.filter(Answer.id.in_(item_ids)).delete(synchronize_session=False)
+
+    # One summary per affected author, all sent with a single executemany insert
+    by_author = {}
+    for row in rows:
+        by_author.setdefault(row[1], []).append(row)
+    verb = 'approved' if action == 'approve' else 'rejected by a moderator'
+    notifications = []
+    for user_id, items in by_author.items():
+        if len(items) == 1:
+            _, _, question_id, title = items[0]
+            content = f"Your {type} was {verb}: {title}"
+            link = url_for('main.view_question', id=question_id) if action == 'approve' else None
+        else:
+            content = f"{len(items)} of your {type}s were {verb}"
+            link = None
+        notifications.append({'user_id': user_id, 'content': content, 'link': link})
+    db.session.execute(db.insert(Notification), notifications)
+
+    if model is Answer:
+        mark_ranking_stale([question_id for _, _, question_id, _ in rows])
+
+    db.session.commit()
+    return len(item_ids)
+
+FEED_SORTS = {
+    'newest': (None, Question.created_at.desc()),
+    'hot': (None, Question.hot_score.desc()),
+    'unanswered': (Question.unanswered_score.isnot(None), Question.unanswered_score.desc()),
+    'views': (None, Question.views.desc()),
+}
+
+RANKING_EPOCH = datetime(2025, 1, 1)
+
+def ranking_score(activity, created_at):
+    """Log-scaled activity plus a creation-time term. Newer questions need ten times
+    less activity per RANKING_DECAY_SECONDS of age to rank level, so the score decays
+    relative to the feed without ever being recomputed just because time passed."""
+    order = math.log10(max(abs(activity), 1))
+    sign = 1 if activity > 0 else -1 if activity < 0 else 0
+    seconds = (created_at - RANKING_EPOCH).total_seconds()
+    return round(sign * order + seconds / current_app.config['RANKING_DECAY_SECONDS'], 7)
+
+def question_rankings(created_at, vote_score=0, answer_count=0, views=0):
+    activity = vote_score + 2 * answer_count + (views or 0) / 10
+    hot = ranking_score(activity, created_at)
+    return {
+        'vote_score': vote_score,
+        'answer_count': answer_count,
+        'hot_score': hot,
+        'unanswered_score': hot if answer_count == 0 else None,
+    }
+
+def mark_ranking_stale(question_ids):
+    """Flag questions whose votes, answers or views changed for the next refresh"""
+    Question.query.filter(Question.id.in_(set(question_ids))).update(
+        {'ranking_stale': True}, synchronize_session=False)
+
+def refresh_rankings(batch_size=None):
+    """Recompute ranking columns for stale questions only, returns the number refreshed"""
+    batch_size = batch_size or current_app.config['RANKING_REFRESH_BATCH']
+    ids = [id for (id,) in db.session.query(Question.id).filter(
+        Question.ranking_stale == True
+    ).order_by(Question.id).limit(batch_size).all()]
+    if not ids:
+        return 0
+
+    # Clear the flag before reading any inputs so activity landing mid-refresh marks the row again
+    Question.query.filter(Question.id.in_(ids)).update(
+        {'ranking_stale': False}, synchronize_session=False)
+
+    stale = db.session.query(Question.id, Question.created_at, Question.views).filter(
+        Question.id.in_(ids)
+    ).all()
+
+    votes = dict(db.session.query(
+        Vote.question_id,
+        db.func.sum(db.case((Vote.vote_type == 'up', 1), else_=-1))
+    ).filter(Vote.question_id.in_(ids)).group_by(Vote.question_id).all())
+    answers = dict(db.session.query(Answer.question_id, db.func.count(Answer.id)).filter(
+        Answer.question_id.in_(ids), Answer.is_approved == True
+    ).group_by(Answer.question_id).all())
+
+    db.session.execute(db.update(Question), [
+        dict(id=row.id, **question_rankings(row.created_at or datetime.utcnow(),
+                                            votes.get(row.id, 0),
+                                            answers.get(row.id, 0),
+                                            row.views))
+        for row in stale
+    ])
+    db.session.commit()
+    return len(stale)
+
+def run_ranking_scheduler(app):
+    """Refresh stale rankings every RANKING_REFRESH_INTERVAL seconds, forever"""
+    while True:
+        with app.app_context():
+            try:
+                # Drain the backlog before sleeping
+                while refresh_rankings() == app.config['RANKING_REFRESH_BATCH']:
+                    pass
+            except Exception as e:
+                db.session.rollback()
+                app.logger.error(f"Error refreshing rankings: {str(e)}")
+        time.sleep(app.config['RANKING_REFRESH_INTERVAL'])
+
+def start_ranking_scheduler(app):
+    """Run the ranking scheduler in a daemon thread, for the single-process dev server"""
+    thread = threading.Thread(target=run_ranking_scheduler, args=(app,),
+                              name='ranking-scheduler', daemon=True)
+    thread.start()
+    return thread
+
 def create_default_data():
     """Create default categories and admin user"""
-    with app.app_context():
-        if not Category.query.first():
-            categories = [
-                Category(name='General', description='General programming questions'),
-                Category(name='Python', description='Python programming questions'),
-                Category(name='JavaScript', description='JavaScript programming questions'),
-                Category(name='Web Development', description='HTML, CSS, and web development'),
-                Category(name='Database', description='Database related questions'),
-                Category(name='Mobile Development', description='Mobile app development'),
-            ]
-            db.session.add_all(categories)
-        
-        if not User.query.filter_by(username='admin').first():
-            admin = User(
-                username='admin',
-                email='admin@stackit.com',
-                password_hash=generate_password_hash('admin123'),
-                is_admin=True,
-                bio='System Administrator'
-            )
-            db.session.add(admin)
-        
-        db.session.commit()
+    if not Category.query.first():
+        categories = [
+            Category(name='General', description='General programming questions'),
+            Category(name='Python', description='Python programming questions'),
+            Category(name='JavaScript', description='JavaScript programming questions'),
+            Category(name='Web Development', description='HTML, CSS, and web development'),
+            Category(name='Database', description='Database related questions'),
+            Category(name='Mobile Development', description='Mobile app development'),
+        ]
+        db.session.add_all(categories)
+    
+    if not User.query.filter_by(username='admin').first():
+        admin = User(
+            username='admin',
+            email='admin@stackit.com',
+            password_hash=generate_password_hash('admin123'),
+            is_admin=True,
+            bio='System Administrator'
+        )
+        db.session.add(admin)
+    
+    db.session.commit()
 
 # ========== ROUTES ==========
-@app.route('/upload', methods=['POST'])
+@bp.route('/readyz')
+def readiness():
+    """Ready once the database is reachable and every mapped column exists, so a
+    database that still needs `flask init-db` reports 503"""
+    try:
+        for table in db.metadata.sorted_tables:
+            db.session.execute(db.select(*table.columns).limit(1))
+        return jsonify({'status': 'ready'})
+    except Exception as e:
+        db.session.rollback()
+        current_app.logger.error(f"Readiness check failed: {str(e)}")
+        return jsonify({'status': 'unavailable'}), 503
+
+@bp.route('/upload', methods=['POST'])
 @login_required
 def upload():
     f = request.files.get('upload')
@@ -171,12 +266,12 @@ def upload():
         return upload_fail('No file uploaded!')
     
     filename = secure_filename(f.filename)
-    filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
+    filepath = os.path.join(current_app.config['UPLOAD_FOLDER'], filename)
     f.save(filepath)
     url = url_for('static', filename=f'uploads/{filename}')
     return upload_success(url, filename)
 
-@app.route('/notifications')
+@bp.route('/notifications')
 @login_required
 def get_notifications():
     notifications = Notification.query.filter_by(
@@ -191,7 +286,7 @@ def get_notifications():
         'created_at': n.created_at.strftime('%b %d, %H:%M')
     } for n in notifications])
 
-@app.route('/notifications/mark_read/<int:id>')
+@bp.route('/notifications/mark_read/<int:id>')
 @login_required
 def mark_notification_read(id):
     notification = Notification.query.get_or_404(id)
@@ -202,13 +297,19 @@ def mark_notification_read(id):
     db.session.commit()
     return jsonify({'success': True})
 
-@app.route('/')
+@bp.route('/')
 def index():
     try:
         search_query = request.args.get('search', '')
         category_filter = request.args.get('category', '')
+        sort = request.args.get('sort', 'newest')
+        if sort not in FEED_SORTS:
+            sort = 'newest'
+        sort_filter, sort_order = FEED_SORTS[sort]
         
         query = Question.query.filter_by(is_approved=True)
+        if sort_filter is not None:
+            query = query.filter(sort_filter)
         
         if search_query:
             query = query.filter(Question.title.contains(search_query) | 
@@ -217,20 +318,21 @@ def index():
         if category_filter:
             query = query.filter_by(category_id=category_filter)
         
-        questions = query.order_by(Question.created_at.desc()).limit(20).all()
+        questions = query.order_by(sort_order).limit(20).all()
         categories = Category.query.all()
         
         return render_template('index.html', 
                              questions=questions, 
                              categories=categories,
                              search_query=search_query, 
-                             category_filter=category_filter)
+                             category_filter=category_filter,
+                             sort=sort)
     except Exception as e:
-        app.logger.error(f"Error in index route: {str(e)}")
+        current_app.logger.error(f"Error in index route: {str(e)}")
         flash('An error occurred while loading questions')
-        return redirect(url_for('index'))
+        return redirect(url_for('main.index'))
 
-@app.route('/register', methods=['GET', 'POST'])
+@bp.route('/register', methods=['GET', 'POST'])
 def register():
     if request.method == 'POST':
         username = request.form['username']
@@ -239,11 +341,11 @@ def register():
         
         if User.query.filter_by(username=username).first():
             flash('Username already exists')
-            return redirect(url_for('register'))
+            return redirect(url_for('main.register'))
         
         if User.query.filter_by(email=email).first():
             flash('Email already exists')
-            return redirect(url_for('register'))
+            return redirect(url_for('main.register'))
         
         user = User(
             username=username,
@@ -254,11 +356,11 @@ def register():
         db.session.add(user)
         db.session.commit()
         flash('Registration successful')
-        return redirect(url_for('login'))
+        return redirect(url_for('main.login'))
     
     return render_template('register.html')
 
-@app.route('/login', methods=['GET', 'POST'])
+@bp.route('/login', methods=['GET', 'POST'])
 def login():
     if request.method == 'POST':
         username = request.form['username']
@@ -268,18 +370,18 @@ def login():
         
         if user and check_password_hash(user.password_hash, password):
             login_user(user)
-            return redirect(url_for('index'))
+            return redirect(url_for('main.index'))
         flash('Invalid username or password')
     
     return render_template('login.html')
 
-@app.route('/logout')
+@bp.route('/logout')
 @login_required
 def logout():
     logout_user()
-    return redirect(url_for('index'))
+    return redirect(url_for('main.index'))
 
-@app.route('/ask', methods=['GET', 'POST'])
+@bp.route('/ask', methods=['GET', 'POST'])
 @login_required
 def ask_question():
     if request.method == 'POST':
@@ -289,16 +391,20 @@ def ask_question():
             
             if not title or not content:
                 flash('Title and content are required')
-                return redirect(url_for('ask_question'))
+                return redirect(url_for('main.ask_question'))
             
             tag_names = validate_tags(request.form.get('tags', ''))
             category_id = request.form.get('category_id')
             
+            created_at = datetime.utcnow()
             question = Question(
                 title=title,
                 content=content,
                 user_id=current_user.id,
-                category_id=category_id if category_id else None
+                category_id=category_id if category_id else None,
+                created_at=created_at,
+                ranking_stale=False,
+                **question_rankings(created_at)
             )
             
             # Handle tags
@@ -312,22 +418,23 @@ def ask_question():
             db.session.add(question)
             db.session.commit()
             flash('Question posted successfully')
-            return redirect(url_for('view_question', id=question.id))
+            return redirect(url_for('main.view_question', id=question.id))
         
         except Exception as e:
             db.session.rollback()
-            app.logger.error(f"Error posting question: {str(e)}")
+            current_app.logger.error(f"Error posting question: {str(e)}")
             flash('An error occurred while posting your question')
-            return redirect(url_for('ask_question'))
+            return redirect(url_for('main.ask_question'))
     
     categories = Category.query.all()
     return render_template('ask.html', categories=categories)
 
-@app.route('/question/<int:id>')
+@bp.route('/question/<int:id>')
 def view_question(id):
     try:
         question = Question.query.get_or_404(id)
         question.views += 1
+        question.ranking_stale = True
         db.session.commit()
         
         answers = Answer.query.filter_by(
@@ -339,11 +446,11 @@ def view_question(id):
                              question=question, 
                              answers=answers)
     except Exception as e:
-        app.logger.error(f"Error viewing question: {str(e)}")
+        current_app.logger.error(f"Error viewing question: {str(e)}")
         flash('An error occurred while loading the question')
-        return redirect(url_for('index'))
+        return redirect(url_for('main.index'))
 
-@app.route('/question/edit/<int:id>', methods=['GET', 'POST'])
+@bp.route('/question/edit/<int:id>', methods=['GET', 'POST'])
 @login_required
 def edit_question(id):
     question = Question.query.get_or_404(id)
@@ -351,7 +458,7 @@ def edit_question(id):
     # Authorization check
     if current_user.id != question.user_id and not current_user.is_admin:
         flash('You are not authorized to edit this question')
-        return redirect(url_for('view_question', id=id))
+        return redirect(url_for('main.view_question', id=id))
     
     if request.method == 'POST':
         try:
@@ -360,7 +467,7 @@ def edit_question(id):
             
             if not question.title or not question.content:
                 flash('Title and content are required')
-                return redirect(url_for('edit_question', id=id))
+                return redirect(url_for('main.edit_question', id=id))
             
             question.category_id = request.form.get('category_id')
             question.updated_at = datetime.utcnow()
@@ -384,13 +491,13 @@ def edit_question(id):
             
             db.session.commit()
             flash('Question updated successfully')
-            return redirect(url_for('view_question', id=id))
+            return redirect(url_for('main.view_question', id=id))
         
         except Exception as e:
             db.session.rollback()
-            app.logger.error(f"Error updating question: {str(e)}")
+            current_app.logger.error(f"Error updating question: {str(e)}")
             flash('An error occurred while updating the question')
-            return redirect(url_for('edit_question', id=id))
+            return redirect(url_for('main.edit_question', id=id))
     
     categories = Category.query.all()
     current_tags = ','.join([qt.tag.name for qt in question.tags])
@@ -399,7 +506,7 @@ def edit_question(id):
                          categories=categories,
                          current_tags=current_tags)
 
-@app.route('/question/delete/<int:id>', methods=['POST'])
+@bp.route('/question/delete/<int:id>', methods=['POST'])
 @login_required
 def delete_question(id):
     question = Question.query.get_or_404(id)
@@ -407,20 +514,20 @@ def delete_question(id):
     # Authorization check
     if current_user.id != question.user_id and not current_user.is_admin:
         flash('You are not authorized to delete this question')
-        return redirect(url_for('view_question', id=id))
+        return redirect(url_for('main.view_question', id=id))
     
     try:
         db.session.delete(question)
         db.session.commit()
         flash('Question deleted successfully')
-        return redirect(url_for('index'))
+        return redirect(url_for('main.index'))
     except Exception as e:
         db.session.rollback()
-        app.logger.error(f"Error deleting question: {str(e)}")
+        current_app.logger.error(f"Error deleting question: {str(e)}")
         flash('An error occurred while deleting the question')
-        return redirect(url_for('view_question', id=id))
+        return redirect(url_for('main.view_question', id=id))
 
-@app.route('/answer/<int:question_id>', methods=['POST'])
+@bp.route('/answer/<int:question_id>', methods=['POST'])
 @login_required
 def post_answer(question_id):
     content = request.form['content']
@@ -433,6 +540,7 @@ def post_answer(question_id):
     )
     
     db.session.add(answer)
+    question.ranking_stale = True
     db.session.commit()
     
     # Notify question author
@@ -440,13 +548,13 @@ def post_answer(question_id):
         create_notification(
             user_id=question.author.id,
             content=f"{current_user.username} answered your question: {question.title}",
-            link=url_for('view_question', id=question_id)
+            link=url_for('main.view_question', id=question_id)
         )
     
     flash('Answer posted successfully')
-    return redirect(url_for('view_question', id=question_id))
+    return redirect(url_for('main.view_question', id=question_id))
 
-@app.route('/answer/edit/<int:id>', methods=['GET', 'POST'])
+@bp.route('/answer/edit/<int:id>', methods=['GET', 'POST'])
 @login_required
 def edit_answer(id):
     answer = Answer.query.get_or_404(id)
@@ -454,7 +562,7 @@ def edit_answer(id):
     # Authorization check
     if current_user.id != answer.user_id and not current_user.is_admin:
         flash('You are not authorized to edit this answer')
-        return redirect(url_for('view_question', id=answer.question_id))
+        return redirect(url_for('main.view_question', id=answer.question_id))
     
     if request.method == 'POST':
         try:
@@ -462,22 +570,22 @@ def edit_answer(id):
             
             if not answer.content:
                 flash('Content is required')
-                return redirect(url_for('edit_answer', id=id))
+                return redirect(url_for('main.edit_answer', id=id))
             
             answer.updated_at = datetime.utcnow()
             db.session.commit()
             flash('Answer updated successfully')
-            return redirect(url_for('view_question', id=answer.question_id))
+            return redirect(url_for('main.view_question', id=answer.question_id))
         
         except Exception as e:
             db.session.rollback()
-            app.logger.error(f"Error updating answer: {str(e)}")
+            current_app.logger.error(f"Error updating answer: {str(e)}")
             flash('An error occurred while updating the answer')
-            return redirect(url_for('edit_answer', id=id))
+            return redirect(url_for('main.edit_answer', id=id))
     
     return render_template('edit_answer.html', answer=answer)
 
-@app.route('/answer/delete/<int:id>', methods=['POST'])
+@bp.route('/answer/delete/<int:id>', methods=['POST'])
 @login_required
 def delete_answer(id):
     answer = Answer.query.get_or_404(id)
@@ -486,20 +594,21 @@ def delete_answer(id):
     # Authorization check
     if current_user.id != answer.user_id and not current_user.is_admin:
         flash('You are not authorized to delete this answer')
-        return redirect(url_for('view_question', id=question_id))
+        return redirect(url_for('main.view_question', id=question_id))
     
     try:
         db.session.delete(answer)
+        mark_ranking_stale([question_id])
         db.session.commit()
         flash('Answer deleted successfully')
     except Exception as e:
         db.session.rollback()
-        app.logger.error(f"Error deleting answer: {str(e)}")
+        current_app.logger.error(f"Error deleting answer: {str(e)}")
         flash('An error occurred while deleting the answer')
     
-    return redirect(url_for('view_question', id=question_id))
+    return redirect(url_for('main.view_question', id=question_id))
 
-@app.route('/vote', methods=['POST'])
+@bp.route('/vote', methods=['POST'])
 @login_required
 def vote():
     data = request.get_json()
@@ -527,6 +636,8 @@ def vote():
         )
         db.session.add(vote)
     
+    if question_id:
+        mark_ranking_stale([question_id])
     db.session.commit()
     
     # Notify content author
@@ -542,12 +653,12 @@ def vote():
             create_notification(
                 user_id=content.author.id,
                 content=f"{current_user.username} voted on your answer",
-                link=url_for('view_question', id=content.question_id)
+                link=url_for('main.view_question', id=content.question_id)
             )
     
     return jsonify({'score': score})
 
-@app.route('/answer/accept/<int:id>', methods=['POST'])
+@bp.route('/answer/accept/<int:id>', methods=['POST'])
 @login_required
 def accept_answer(id):
     answer = Answer.query.get_or_404(id)
@@ -570,16 +681,16 @@ def accept_answer(id):
             create_notification(
                 user_id=answer.author.id,
                 content=f"Your answer was accepted for: {question.title}",
-                link=url_for('view_question', id=question.id)
+                link=url_for('main.view_question', id=question.id)
             )
         
         return jsonify({'success': True})
     except Exception as e:
         db.session.rollback()
-        app.logger.error(f"Error accepting answer: {str(e)}")
+        current_app.logger.error(f"Error accepting answer: {str(e)}")
         return jsonify({'success': False, 'message': 'An error occurred'}), 500
 
-@app.route('/profile/<username>')
+@bp.route('/profile/<username>')
 def profile(username):
     user = User.query.filter_by(username=username).first_or_404()
     questions = Question.query.filter_by(
@@ -597,12 +708,12 @@ def profile(username):
                          questions=questions, 
                          answers=answers)
 
-@app.route('/admin')
+@bp.route('/admin')
 @login_required
 def admin_dashboard():
     if not current_user.is_admin:
         flash('Access denied')
-        return redirect(url_for('index'))
+        return redirect(url_for('main.index'))
     
     stats = {
         'total_users': User.query.count(),
@@ -625,12 +736,12 @@ def admin_dashboard():
                          recent_questions=recent_questions, 
                          recent_users=recent_users)
 
-@app.route('/admin/approve/<type>/<int:id>')
+@bp.route('/admin/approve/<type>/<int:id>')
 @login_required
 def approve_content(type, id):
     if not current_user.is_admin:
         flash('Access denied')
-        return redirect(url_for('index'))
+        return redirect(url_for('main.index'))
     
     if type == 'question':
         item = Question.query.get_or_404(id)
@@ -638,17 +749,193 @@ def approve_content(type, id):
         item = Answer.query.get_or_404(id)
     else:
         flash('Invalid content type')
-        return redirect(url_for('admin_dashboard'))
+        return redirect(url_for('main.admin_dashboard'))
     
     item.is_approved = True
+    if type == 'answer':
+        mark_ranking_stale([item.question_id])
     db.session.commit()
     
     flash(f'{type.capitalize()} approved successfully')
-    return redirect(url_for('admin_dashboard'))
+    return redirect(url_for('main.admin_dashboard'))
+
+@bp.route('/admin/moderation')
+@login_required
+def moderation_queue():
+    if not current_user.is_admin:
+        flash('Access denied')
+        return redirect(url_for('main.index'))
+
+    questions, next_question = get_pending_items(Question, request.args.get('q_after', type=int))
+    answers, next_answer = get_pending_items(Answer, request.args.get('a_after', type=int))
+
+    return render_template('moderation.html',
+                         questions=questions,
+                         answers=answers,
+                         next_question=next_question,
+                         next_answer=next_answer)
+
+@bp.route('/admin/moderation/bulk', methods=['POST'])
+@login_required
+def bulk_moderate():
+    if not current_user.is_admin:
+        flash('Access denied')
+        return redirect(url_for('main.index'))
+
+    type = request.form.get('type')
+    action = request.form.get('action')
+    if type not in MODERATION_MODELS or action not in MODERATION_ACTIONS:
+        flash('Invalid moderation request')
+        return redirect(url_for('main.moderation_queue'))
+
+    ids = parse_moderation_ids(request.form.getlist('ids'))
+    if ids is None:
+        flash('Invalid moderation request')
+        return redirect(url_for('main.moderation_queue'))
+    
+    limit = current_app.config['MODERATION_BULK_LIMIT']
+    if len(ids) > limit:
+        flash(f'At most {limit} items can be moderated at once')
+        return redirect(url_for('main.moderation_queue'))
+
+    try:
+        count = moderate_items(type, ids, action)
+        flash(f'{count} {type}(s) {MODERATION_ACTIONS[action]}')
+    except Exception as e:
+        db.session.rollback()
+        current_app.logger.error(f"Error moderating content: {str(e)}")
+        flash('An error occurred while moderating content')
+
+    return redirect(url_for('main.moderation_queue'))
+
+@bp.route('/api/admin/moderation')
+@login_required
+def api_moderation_queue():
+    if not current_user.is_admin:
+        return jsonify({'success': False, 'message': 'Unauthorized'}), 403
+
+    type = request.args.get('type', 'question')
+    if type not in MODERATION_MODELS:
+        return jsonify({'success': False, 'message': 'Invalid content type'}), 400
+
+    limit = min(request.args.get('limit', current_app.config['MODERATION_PAGE_SIZE'], type=int),
+                current_app.config['MODERATION_BULK_LIMIT'])
+    items, next_after = get_pending_items(MODERATION_MODELS[type],
+                                          request.args.get('after', type=int),
+                                          max(limit, 1))
+
+    return jsonify({
+        'items': [{
+            'id': item.id,
+            'title': item.title if type == 'question' else None,
+            'question_id': item.id if type == 'question' else item.question_id,
+            'content': item.content[:300],
+            'author': item.author.username,
+            'created_at': item.created_at.strftime('%b %d, %H:%M')
+        } for item in items],
+        'next_after': next_after
+    })
+
+@bp.route('/api/admin/moderation', methods=['POST'])
+@login_required
+def api_bulk_moderate():
+    if not current_user.is_admin:
+        return jsonify({'success': False, 'message': 'Unauthorized'}), 403
+
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        return jsonify({'success': False, 'message': 'Invalid moderation request'}), 400
+    
+    type = data.get('type')
+    action = data.get('action')
+    ids = data.get('ids') or []
+    if type not in MODERATION_MODELS or action not in MODERATION_ACTIONS or not isinstance(ids, list):
+        return jsonify({'success': False, 'message': 'Invalid moderation request'}), 400
+    
+    ids = parse_moderation_ids(ids)
+    if ids is None:
+        return jsonify({'success': False, 'message': 'Invalid moderation request'}), 400
+    
+    limit = current_app.config['MODERATION_BULK_LIMIT']
+    if len(ids) > limit:
+        return jsonify({'success': False, 'message': f'At most {limit} items per request'}), 400
+
+    try:
+        count = moderate_items(type, ids, action)
+        return jsonify({'success': True, 'processed': count})
+    except Exception as e:
+        db.session.rollback()
+        current_app.logger.error(f"Error moderating content: {str(e)}")
+        return jsonify({'success': False, 'message': 'An error occurred'}), 500
+
+# ========== CLI COMMANDS ==========
+def add_missing_columns():
+    """Add mapped columns that existing tables lack, e.g. the ranking columns on a
+    database created before them. create_all() never alters existing tables. Safe to
+    re-run; returns the columns added."""
+    inspector = db.inspect(db.engine)
+    existing_tables = set(inspector.get_table_names())
+    added = []
+    with db.engine.begin() as conn:
+        preparer = conn.dialect.identifier_preparer
+        for table in db.metadata.sorted_tables:
+            if table.name not in existing_tables:
+                continue
+            existing = {column['name'] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing:
+                    continue
+                ddl = (f'ALTER TABLE {preparer.format_table(table)} '
+                       f'ADD COLUMN {preparer.format_column(column)} '
+                       f'{column.type.compile(dialect=conn.dialect)}')
+                # Backfill existing rows with the Python-side default, e.g. ranking_stale
+                # so the scheduler scores every pre-existing question
+                if column.default is not None and column.default.is_scalar:
+                    default = db.literal(column.default.arg, column.type).compile(
+                        dialect=conn.dialect, compile_kwargs={'literal_binds': True})
+                    ddl += f' DEFAULT {default}'
+                conn.exec_driver_sql(ddl)
+                added.append(f'{table.name}.{column.name}')
+    return added
+
+@bp.cli.command('init-db')
+def init_db_command():
+    """Create missing tables, columns and indexes"""
+    db.create_all()
+    for column in add_missing_columns():
+        click.echo(f'Added column {column}')
+    # create_all() skips existing tables, so add indexes introduced since they were built
+    for table in db.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(db.engine, checkfirst=True)
+    click.echo('Database initialized')
+
+@bp.cli.command('seed')
+def seed_command():
+    """Create default categories and admin user"""
+    create_default_data()
+    click.echo('Default data created')
+
+@bp.cli.command('refresh-rankings')
+def refresh_rankings_command():
+    """Recompute feed rankings for every stale question"""
+    total = 0
+    while True:
+        count = refresh_rankings()
+        total += count
+        if count < current_app.config['RANKING_REFRESH_BATCH']:
+            break
+    click.echo(f'Refreshed rankings for {total} question(s)')
+
+@bp.cli.command('run-scheduler')
+def run_scheduler_command():
+    """Keep feed rankings fresh; run as one process alongside the web workers"""
+    run_ranking_scheduler(current_app._get_current_object())
 
 # ========== APPLICATION START ==========
 if __name__ == '__main__':
-    with app.app_context():
-        db.create_all()
-        create_default_data()
+    app = create_app()
+    # The debug reloader runs this block in a watcher process too; only schedule in the server
+    if os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        start_ranking_scheduler(app)
     app.run(debug=True)
\ No newline at end of file
@@ -0,0 +1,96 @@
+"""Import-to-first-request latency per worker.
+
+    python benchmarks/startup.py [--workers 4] [--path /readyz]
+
+Cold workers are fresh interpreters that import wsgi and serve one request, as
+a pre-fork server does without --preload. Preloaded workers are forked from a
+parent that already imported wsgi, as with --preload, so they only pay for the
+first request.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def first_request(app, path):
+    start = time.perf_counter()
+    status = app.test_client().get(path).status_code
+    return status, (time.perf_counter() - start) * 1000
+
+
+def cold_worker(path):
+    start = time.perf_counter()
+    from wsgi import app
+    import_ms = (time.perf_counter() - start) * 1000
+    status, request_ms = first_request(app, path)
+    print(json.dumps({'import_ms': import_ms, 'request_ms': request_ms, 'status': status}))
+
+
+def run_cold(workers, path):
+    results = []
+    for _ in range(workers):
+        out = subprocess.run([sys.executable, __file__, '--cold-worker', '--path', path],
+                             cwd=ROOT, capture_output=True, text=True, check=True)
+        results.append(json.loads(out.stdout.strip().splitlines()[-1]))
+    return results
+
+
+def run_preloaded(workers, path):
+    start = time.perf_counter()
+    from wsgi import app
+    import_ms = (time.perf_counter() - start) * 1000
+
+    results = []
+    for _ in range(workers):
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            status, request_ms = first_request(app, path)
+            os.write(write_fd, json.dumps({'import_ms': 0.0, 'request_ms': request_ms,
+                                           'status': status}).encode())
+            os._exit(0)
+        os.close(write_fd)
+        with os.fdopen(read_fd) as pipe:
+            results.append(json.loads(pipe.read()))
+        os.waitpid(pid, 0)
+    return import_ms, results
+
+
+def report(label, results):
+    print(f'{label}')
+    print(f"{'worker':>8} {'import ms':>10} {'request ms':>11} {'total ms':>9} {'status':>7}")
+    for i, r in enumerate(results, 1):
+        total = r['import_ms'] + r['request_ms']
+        print(f"{i:>8} {r['import_ms']:>10.1f} {r['request_ms']:>11.1f} {total:>9.1f} {r['status']:>7}")
+    mean = sum(r['import_ms'] + r['request_ms'] for r in results) / len(results)
+    print(f"{'mean':>8} {'':>10} {'':>11} {mean:>9.1f}\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--path', default='/readyz')
+    parser.add_argument('--cold-worker', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    sys.path.insert(0, ROOT)
+    os.chdir(ROOT)
+    if args.cold_worker:
+        cold_worker(args.path)
+        return
+
+    report(f'Cold workers (no --preload), GET {args.path}', run_cold(args.workers, args.path))
+    if hasattr(os, 'fork'):
+        import_ms, results = run_preloaded(args.workers, args.path)
+        report(f'Preloaded workers (--preload, parent import {import_ms:.1f} ms), GET {args.path}',
+               results)
+
+
+if __name__ == '__main__':
+    main()
@@ -2,14 +2,23 @@ import os
 
 class Config:
     SECRET_KEY = os.environ.get('SECRET_KEY') or 'your-secret-key'
-    # SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL') or 'sqlite:///database.db'
-    SQLALCHEMY_DATABASE_URI = 'sqlite:///' + os.path.join(os.path.abspath(os.path.dirname(__file__)), 'database.db')
+    SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL') or \
+        'sqlite:///' + os.path.join(os.path.abspath(os.path.dirname(__file__)), 'database.db')
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     UPLOAD_FOLDER = 'static/uploads'
     MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16MB
     
+    # Moderation queue
+    MODERATION_PAGE_SIZE = 50
+    MODERATION_BULK_LIMIT = 500
+    
+    # Feed rankings
+    RANKING_DECAY_SECONDS = 45000  # age that outweighs a 10x jump in activity
+    RANKING_REFRESH_INTERVAL = 60  # seconds between background refreshes
+    RANKING_REFRESH_BATCH = 500
+    
     # CKEditor configuration
     CKEDITOR_SERVE_LOCAL = True
     CKEDITOR_HEIGHT = 400
-    CKEDITOR_FILE_UPLOADER = 'upload'
+    CKEDITOR_FILE_UPLOADER = 'main.upload'
     CKEDITOR_ENABLE_CSRF = True
\ No newline at end of file
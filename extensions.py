@@ -0,0 +1,9 @@
+from flask_sqlalchemy import SQLAlchemy
+from flask_login import LoginManager
+from flask_ckeditor import CKEditor
+
+# Unbound extensions, attached to each app instance in create_app()
+db = SQLAlchemy()
+ckeditor = CKEditor()
+login_manager = LoginManager()
+login_manager.login_view = 'main.login'
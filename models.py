@@ -0,0 +1,126 @@
+from flask_login import UserMixin
+from datetime import datetime
+from extensions import db, login_manager
+
+class User(UserMixin, db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    username = db.Column(db.String(80), unique=True, nullable=False)
+    email = db.Column(db.String(120), unique=True, nullable=False)
+    password_hash = db.Column(db.String(120), nullable=False)
+    is_admin = db.Column(db.Boolean, default=False)
+    reputation = db.Column(db.Integer, default=0)
+    bio = db.Column(db.Text)
+    profile_picture = db.Column(db.String(120))
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    
+    questions = db.relationship('Question', backref='author', lazy=True)
+    answers = db.relationship('Answer', backref='author', lazy=True)
+    votes = db.relationship('Vote', backref='user', lazy=True)
+    notifications = db.relationship('Notification', backref='user', lazy=True, 
+                                  order_by='Notification.created_at.desc()')
+
+class Category(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(50), unique=True, nullable=False)
+    description = db.Column(db.Text)
+    questions = db.relationship('Question', backref='category', lazy=True)
+
+class Question(db.Model):
+    # Partial indexes over the (small) sets of unapproved and stale rows back the
+    # moderation queue and the ranking refresh
+    __table_args__ = (
+        db.Index('ix_question_pending', 'id',
+                 sqlite_where=db.text('is_approved = 0'),
+                 postgresql_where=db.text('NOT is_approved')),
+        db.Index('ix_question_ranking_stale', 'id',
+                 sqlite_where=db.text('ranking_stale = 1'),
+                 postgresql_where=db.text('ranking_stale')),
+    )
+    
+    id = db.Column(db.Integer, primary_key=True)
+    title = db.Column(db.String(200), nullable=False)
+    content = db.Column(db.Text, nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow)
+    views = db.Column(db.Integer, default=0, index=True)
+    is_approved = db.Column(db.Boolean, default=True)
+    
+    # Precomputed feed rankings, refreshed in the background by refresh_rankings()
+    vote_score = db.Column(db.Integer, default=0)
+    answer_count = db.Column(db.Integer, default=0)
+    hot_score = db.Column(db.Float, default=0, index=True)
+    unanswered_score = db.Column(db.Float, index=True)
+    ranking_stale = db.Column(db.Boolean, default=True)
+    
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    category_id = db.Column(db.Integer, db.ForeignKey('category.id'))
+    
+    answers = db.relationship('Answer', backref='question', lazy=True, 
+                            cascade='all, delete-orphan')
+    votes = db.relationship('Vote', backref='question', lazy=True, 
+                          cascade='all, delete-orphan')
+    tags = db.relationship('QuestionTag', back_populates='question', 
+                         cascade='all, delete-orphan')
+
+    def get_vote_score(self):
+        upvotes = Vote.query.filter_by(question_id=self.id, vote_type='up').count()
+        downvotes = Vote.query.filter_by(question_id=self.id, vote_type='down').count()
+        return upvotes - downvotes
+
+class Answer(db.Model):
+    __table_args__ = (
+        db.Index('ix_answer_pending', 'id',
+                 sqlite_where=db.text('is_approved = 0'),
+                 postgresql_where=db.text('NOT is_approved')),
+    )
+    
+    id = db.Column(db.Integer, primary_key=True)
+    content = db.Column(db.Text, nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow)
+    is_approved = db.Column(db.Boolean, default=True)
+    is_accepted = db.Column(db.Boolean, default=False)
+    
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    question_id = db.Column(db.Integer, db.ForeignKey('question.id'), nullable=False)
+    
+    votes = db.relationship('Vote', backref='answer', lazy=True, 
+                          cascade='all, delete-orphan')
+
+    def get_vote_score(self):
+        upvotes = Vote.query.filter_by(answer_id=self.id, vote_type='up').count()
+        downvotes = Vote.query.filter_by(answer_id=self.id, vote_type='down').count()
+        return upvotes - downvotes
+
+class Vote(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    vote_type = db.Column(db.String(10), nullable=False)  # 'up' or 'down'
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    question_id = db.Column(db.Integer, db.ForeignKey('question.id'), nullable=True)
+    answer_id = db.Column(db.Integer, db.ForeignKey('answer.id'), nullable=True)
+
+class Tag(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(50), unique=True, nullable=False)
+    questions = db.relationship('QuestionTag', back_populates='tag')
+
+class QuestionTag(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    question_id = db.Column(db.Integer, db.ForeignKey('question.id'))
+    tag_id = db.Column(db.Integer, db.ForeignKey('tag.id'))
+    question = db.relationship('Question', back_populates='tags')
+    tag = db.relationship('Tag', back_populates='questions')
+
+class Notification(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    content = db.Column(db.Text, nullable=False)
+    is_read = db.Column(db.Boolean, default=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    link = db.Column(db.String(200))
+
+@login_manager.user_loader
+def load_user(user_id):
+    return User.query.get(int(user_id))
@@ -0,0 +1,12 @@
+"""WSGI entry point for pre-fork servers, e.g.
+
+    gunicorn -w 4 --preload wsgi:app
+
+Building the app opens no database connections, so it can be preloaded in the
+master before forking. Run `flask init-db` and `flask seed` once beforehand,
+and `flask run-scheduler` as a single separate process to keep feed rankings
+fresh.
+"""
+from app import create_app
+
+app = create_app()